@@ -0,0 +1,106 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = [
+#   "pandas",
+#   "statsmodels",
+# ]
+# ///
+"""
+Script para desestacionalizar las series del IPC (descomposición STL)
+Procesa cada serie Region × Codigo en paralelo y guarda los resultados en caché
+"""
+
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.seasonal import STL
+
+from ipc_datos import leer_ipc
+
+CACHE_DIR = 'cache/ajuste_estacional'
+
+# Parámetros de la descomposición (forman parte de la clave de caché)
+PERIODO = 12
+ROBUSTO = True
+
+# Mínimo de observaciones para estimar la estacionalidad (dos ciclos completos)
+MINIMO_OBSERVACIONES = 2 * PERIODO
+
+
+def hash_serie(periodos, valores):
+    """Hash del contenido de una serie junto con los parámetros de STL."""
+    h = hashlib.sha256(f'stl-{PERIODO}-{ROBUSTO}'.encode())
+    h.update(np.ascontiguousarray(periodos, dtype='datetime64[ns]').tobytes())
+    h.update(np.ascontiguousarray(valores, dtype='float64').tobytes())
+    return h.hexdigest()
+
+
+def ajustar_serie(valores):
+    """Devuelve la serie sin su componente estacional."""
+    resultado = STL(valores, period=PERIODO, robust=ROBUSTO).fit()
+    return valores - resultado.seasonal
+
+
+def desestacionalizar(df, columna='v_m_IPC', cache_dir=CACHE_DIR, max_workers=None, mp_context=None,
+                      podar=False):
+    """
+    Desestacionaliza `columna` para cada serie Region × Codigo.
+    Devuelve (serie alineada con df.index, cantidad de series recalculadas).
+    Solo se recalculan las series cuyo contenido no está en la caché; las que
+    no tienen suficientes datos quedan en NaN.
+    `mp_context` permite elegir cómo se crean los procesos (por ejemplo
+    'spawn' si se llama desde un proceso con varios hilos).
+    Con `podar=True` se borran de la caché las entradas que no usó esta
+    ejecución; solo tiene sentido si df contiene todas las series.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    resultado = pd.Series(np.nan, index=df.index, name=f'{columna}_desest')
+
+    datos = df[df[columna].notna()].sort_values('Periodo')
+    pendientes = []
+    usadas = set()
+    for _, serie in datos.groupby(['Region', 'Codigo'], sort=False):
+        if len(serie) < MINIMO_OBSERVACIONES:
+            continue
+        valores = serie[columna].to_numpy(dtype='float64')
+        clave = hash_serie(serie['Periodo'].to_numpy(), valores)
+        ruta = os.path.join(cache_dir, f'{clave}.npy')
+        usadas.add(f'{clave}.npy')
+        if os.path.exists(ruta):
+            resultado.loc[serie.index] = np.load(ruta)
+        else:
+            pendientes.append((serie.index, valores, ruta))
+
+    # Calcular en paralelo solo las series nuevas o modificadas
+    if pendientes:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            ajustadas = executor.map(ajustar_serie, [valores for _, valores, _ in pendientes])
+            for (indice, _, ruta), ajustada in zip(pendientes, ajustadas):
+                np.save(ruta, ajustada)
+                resultado.loc[indice] = ajustada
+
+    # Las series de meses anteriores quedan con otro hash y ya no se usan
+    if podar:
+        for nombre in os.listdir(cache_dir):
+            if nombre.endswith('.npy') and nombre not in usadas:
+                os.remove(os.path.join(cache_dir, nombre))
+
+    return resultado, len(pendientes)
+
+
+if __name__ == '__main__':
+    print('Cargando datos del IPC desde INDEC...')
+    df = leer_ipc()
+
+    print('Desestacionalizando series Region × Codigo...')
+    inicio = time.perf_counter()
+    serie, recalculadas = desestacionalizar(df, podar=True)
+    total = df.groupby(['Region', 'Codigo']).ngroups
+
+    print(f'✓ {total} series procesadas en {time.perf_counter() - inicio:.2f}s '
+          f'({recalculadas} recalculadas, {total - recalculadas} desde caché)')
+    print(f'Caché en {CACHE_DIR}/')
@@ -0,0 +1,182 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = [
+#   "pandas",
+# ]
+# ///
+"""
+Script para medir el escalado de la lectura por bloques del IPC
+Genera CSV sintéticos de millones de filas con el formato del INDEC y compara
+el pico de memoria de la lectura completa contra la lectura por bloques, con la
+misma lectura que usa analizar_ipc.py (historia completa de la región)
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from ipc_datos import OPCIONES_CSV, TAMANO_CHUNK, leer_ipc, leer_region_por_chunks
+
+REGIONES = ['GBA', 'Pampeana', 'Noreste', 'Noroeste', 'Cuyo', 'Patagonia', 'Nacional']
+
+# Crecimiento admitido del pico de la lectura por bloques respecto del archivo más chico,
+# en veces el crecimiento del resultado; por encima, el pico dependería del archivo
+MARGEN_MEMORIA = 3.0
+
+
+def generar_csv_sintetico(ruta, filas, periodos=120):
+    """Escribe un CSV con el formato del INDEC y aproximadamente `filas` filas."""
+    codigos = max(1, filas // (periodos * len(REGIONES)))
+    fechas = pd.period_range('2016-12', periods=periodos, freq='M').strftime('%Y%m').astype(int)
+
+    # Mismo orden que el archivo del INDEC: Codigo, Periodo, Region
+    codigo, periodo, region = np.meshgrid(
+        np.arange(codigos), fechas, np.arange(len(REGIONES)), indexing='ij'
+    )
+    n = codigo.size
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Codigo': [f'{c:05d}' for c in codigo.ravel()],
+        'Descripcion': [f'Apertura {c}' for c in codigo.ravel()],
+        'Clasificador': 'Aperturas',
+        'Periodo': periodo.ravel(),
+        'Indice_IPC': rng.uniform(100, 10000, n).round(2),
+        'v_m_IPC': rng.normal(3, 2, n).round(1),
+        'v_i_a_IPC': rng.normal(60, 30, n).round(1),
+        'Region': np.array(REGIONES)[region.ravel()],
+    })
+    df.to_csv(ruta, index=False, sep=OPCIONES_CSV['sep'], decimal=OPCIONES_CSV['decimal'],
+              encoding=OPCIONES_CSV['encoding'])
+    return n
+
+
+def pico_memoria_mb():
+    """Pico de memoria residente del proceso actual en MB."""
+    # En Linux, ru_maxrss se hereda a través de exec; VmHWM es propio del proceso
+    try:
+        with open('/proc/self/status') as f:
+            for linea in f:
+                if linea.startswith('VmHWM:'):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def medir(modo, ruta, region, periodo_inicial, tamano_chunk):
+    """Ejecuta una lectura e imprime filas, segundos, pico de memoria y tamaño del resultado (MB)."""
+    inicio = time.perf_counter()
+    if modo == 'completo':
+        df = leer_ipc(ruta)
+        df = df[df['Region'] == region]
+        if periodo_inicial:
+            df = df[df['Periodo'] >= pd.to_datetime(periodo_inicial, format='%Y%m')]
+    else:
+        df, _ = leer_region_por_chunks(region, periodo_inicial, ruta, tamano_chunk)
+    segundos = time.perf_counter() - inicio
+    pico_mb = pico_memoria_mb()
+    resultado_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+    print(f'{len(df)} {segundos:.3f} {pico_mb:.1f} {resultado_mb:.1f}')
+
+
+def medir_en_subproceso(modo, ruta, args):
+    """Mide cada lectura en un proceso aparte para aislar el pico de memoria."""
+    # El período se reenvía siempre ('' = sin filtro) para que el hijo no aplique otro default
+    comando = [sys.executable, __file__, '--medir', modo, '--archivo', ruta,
+               '--region', args.region, '--tamano-chunk', str(args.tamano_chunk),
+               '--periodo-inicial', args.periodo_inicial or '']
+    salida = subprocess.run(comando, capture_output=True, text=True, check=True).stdout
+    filas, segundos, pico_mb, resultado_mb = salida.split()
+    return int(filas), float(segundos), float(pico_mb), float(resultado_mb)
+
+
+if __name__ == '__main__':
+    # Configurar argumentos de línea de comandos
+    parser = argparse.ArgumentParser(
+        description='Mide el pico de memoria de la lectura por bloques sobre CSV sintéticos'
+    )
+    parser.add_argument(
+        '--filas',
+        type=int,
+        nargs='+',
+        default=[1_000_000, 2_000_000, 4_000_000],
+        help='Tamaños de los archivos sintéticos (default: 1M 2M 4M)'
+    )
+    parser.add_argument(
+        '--region',
+        type=str,
+        default='Nacional',
+        help='Región a leer (default: Nacional)'
+    )
+    parser.add_argument(
+        '--periodo-inicial',
+        type=str,
+        default=None,
+        help='Período inicial en formato YYYYMM (default: historia completa, como analizar_ipc.py)'
+    )
+    parser.add_argument(
+        '--tamano-chunk',
+        type=int,
+        default=TAMANO_CHUNK,
+        help=f'Filas por bloque (default: {TAMANO_CHUNK})'
+    )
+    parser.add_argument(
+        '--tolerancia',
+        type=float,
+        default=MARGEN_MEMORIA,
+        help=f'Veces el crecimiento del resultado que puede crecer el pico por bloques (default: {MARGEN_MEMORIA})'
+    )
+    parser.add_argument('--medir', choices=['completo', 'chunks'], help=argparse.SUPPRESS)
+    parser.add_argument('--archivo', type=str, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+    args.periodo_inicial = args.periodo_inicial or None
+
+    if args.medir:
+        medir(args.medir, args.archivo, args.region, args.periodo_inicial, args.tamano_chunk)
+        sys.exit(0)
+
+    print('=' * 80)
+    print('BENCHMARK DE LECTURA POR BLOQUES')
+    print('=' * 80)
+    print(f'Región: {args.region} | Período inicial: {args.periodo_inicial or "historia completa"} | '
+          f'Bloque: {args.tamano_chunk} filas\n')
+
+    print(f'{"Filas CSV":>12s} {"Filas región":>13s} | {"Completo":>20s} | {"Por bloques":>20s} | '
+          f'{"Resultado":>10s} | Acotado')
+
+    fallos = 0
+    referencia = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for filas in sorted(args.filas):
+            ruta = os.path.join(tmp, f'sintetico_{filas}.csv')
+            total = generar_csv_sintetico(ruta, filas)
+
+            _, t_completo, mb_completo, _ = medir_en_subproceso('completo', ruta, args)
+            salida, t_chunks, mb_chunks, mb_resultado = medir_en_subproceso('chunks', ruta, args)
+            os.remove(ruta)
+
+            # El pico por bloques solo puede crecer lo que crece el resultado (con margen)
+            # respecto del archivo más chico, y siempre debe quedar debajo de la lectura completa
+            if referencia is None:
+                referencia = (mb_chunks, mb_resultado)
+            limite = referencia[0] + args.tolerancia * (mb_resultado - referencia[1])
+            acotado = mb_chunks <= limite and mb_chunks < mb_completo
+            fallos += not acotado
+
+            print(f'{total:12d} {salida:13d} | {t_completo:7.2f}s {mb_completo:8.1f} MB | '
+                  f'{t_chunks:7.2f}s {mb_chunks:8.1f} MB | {mb_resultado:7.1f} MB | '
+                  f'{"✓" if acotado else "✗"} (límite {min(limite, mb_completo):.1f} MB)')
+
+    print('=' * 80)
+    if fallos:
+        print(f'✗ En {fallos} tamaño(s) el pico por bloques superó el límite: depende del archivo')
+        sys.exit(1)
+    print('✓ El pico de la lectura por bloques crece con el resultado y no con el archivo')
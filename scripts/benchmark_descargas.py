@@ -0,0 +1,148 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = [
+#   "httpx",
+# ]
+# ///
+"""
+Script para medir la descarga concurrente y condicional contra el servidor local
+Levanta servidor_mock.py en un puerto libre con varios archivos sintéticos y mide
+la descarga secuencial y concurrente, los pedidos condicionales (304) y la
+reanudación de transferencias cortadas (206)
+"""
+
+import argparse
+import asyncio
+import collections
+import os
+import tempfile
+import threading
+import time
+
+from descargar_ipc import descargar_todo, hash_archivo
+from servidor_mock import crear_servidor
+
+
+def generar_archivos(directorio, cantidad, tamano):
+    """Escribe `cantidad` archivos de `tamano` bytes y devuelve sus nombres."""
+    nombres = []
+    for i in range(cantidad):
+        nombre = f'serie_sintetica_{i}.csv'
+        with open(os.path.join(directorio, nombre), 'wb') as f:
+            f.write(os.urandom(tamano))
+        nombres.append(nombre)
+    return nombres
+
+
+def iniciar_servidor(directorio, **opciones):
+    """Levanta el servidor en un hilo y devuelve (servidor, url base)."""
+    servidor = crear_servidor(directorio, puerto=0, registrar=False, **opciones)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    host, puerto = servidor.server_address
+    return servidor, f'http://{host}:{puerto}'
+
+
+def medir(fuentes, url_base, metadatos, max_conexiones):
+    """Ejecuta descargar_todo y devuelve (segundos, conteo de resultados)."""
+    inicio = time.perf_counter()
+    resultados = asyncio.run(descargar_todo(fuentes, url_base, metadatos, max_conexiones))
+    segundos = time.perf_counter() - inicio
+
+    conteo = collections.Counter()
+    for ruta, resultado in resultados.items():
+        if isinstance(resultado, Exception):
+            conteo['error'] += 1
+            continue
+        _, metadatos[ruta], mensaje = resultado
+        conteo['reanudado (206)' if 'reanudado' in mensaje else mensaje] += 1
+    return segundos, conteo
+
+
+def verificar(fuentes, origen):
+    """Comprueba que cada archivo descargado es idéntico al servido."""
+    return all(hash_archivo(ruta) == hash_archivo(os.path.join(origen, nombre))
+               for ruta, nombre in fuentes.items())
+
+
+if __name__ == '__main__':
+    # Configurar argumentos de línea de comandos
+    parser = argparse.ArgumentParser(
+        description='Mide la descarga concurrente y condicional contra el servidor local'
+    )
+    parser.add_argument(
+        '--archivos',
+        type=int,
+        default=6,
+        help='Cantidad de archivos servidos (default: 6)'
+    )
+    parser.add_argument(
+        '--tamano',
+        type=int,
+        default=2_000_000,
+        help='Tamaño de cada archivo en bytes (default: 2000000)'
+    )
+    parser.add_argument(
+        '--latencia',
+        type=float,
+        default=0.2,
+        help='Segundos de demora por pedido en el servidor (default: 0.2)'
+    )
+    parser.add_argument(
+        '--max-conexiones',
+        type=int,
+        default=4,
+        help='Conexiones simultáneas del modo concurrente (default: 4)'
+    )
+
+    args = parser.parse_args()
+
+    print('=' * 80)
+    print('BENCHMARK DE DESCARGAS')
+    print('=' * 80)
+    print(f'{args.archivos} archivos de {args.tamano} bytes | Latencia: {args.latencia}s | '
+          f'Conexiones: {args.max_conexiones}\n')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        origen = os.path.join(tmp, 'servidor')
+        os.makedirs(origen)
+        nombres = generar_archivos(origen, args.archivos, args.tamano)
+
+        servidor, url_base = iniciar_servidor(origen, latencia=args.latencia)
+        # La mitad de cada archivo: el servidor corta la conexión y queda un .part
+        servidor_cortado, url_cortada = iniciar_servidor(
+            origen, latencia=args.latencia, cortar_en=args.tamano // 2
+        )
+
+        escenarios = []
+        for modo, conexiones in [('secuencial', 1), ('concurrente', args.max_conexiones)]:
+            destino = os.path.join(tmp, modo)
+            os.makedirs(destino)
+            fuentes = {os.path.join(destino, nombre): nombre for nombre in nombres}
+            metadatos = {}
+
+            segundos, conteo = medir(fuentes, url_base, metadatos, conexiones)
+            escenarios.append((f'Descarga inicial {modo}', segundos, conteo, verificar(fuentes, origen)))
+
+            # Segunda pasada con ETag/Last-Modified guardados: todo debería dar 304
+            segundos, conteo = medir(fuentes, url_base, metadatos, conexiones)
+            escenarios.append((f'Condicional {modo}', segundos, conteo, verificar(fuentes, origen)))
+
+        # Transferencia cortada y reanudación con Range/If-Range contra el servidor normal
+        destino = os.path.join(tmp, 'reanudacion')
+        os.makedirs(destino)
+        fuentes = {os.path.join(destino, nombre): nombre for nombre in nombres}
+        metadatos = {}
+        segundos, conteo = medir(fuentes, url_cortada, metadatos, args.max_conexiones)
+        escenarios.append(('Descarga cortada', segundos, conteo, None))
+        segundos, conteo = medir(fuentes, url_base, metadatos, args.max_conexiones)
+        escenarios.append(('Reanudación', segundos, conteo, verificar(fuentes, origen)))
+
+        servidor.shutdown()
+        servidor_cortado.shutdown()
+
+    print(f'{"Escenario":28s} {"Tiempo":>9s}  {"Íntegro":7s}  Resultados')
+    for nombre, segundos, conteo, integro in escenarios:
+        estado = '-' if integro is None else ('sí' if integro else 'NO')
+        resultados = ', '.join(f'{n} {mensaje}' for mensaje, n in sorted(conteo.items()))
+        print(f'{nombre:28s} {segundos:8.2f}s  {estado:7s}  {resultados}')
+    print('=' * 80)
@@ -3,6 +3,7 @@
 # dependencies = [
 #   "pandas",
 #   "plotly",
+#   "statsmodels",
 # ]
 # ///
 """
@@ -10,253 +11,499 @@ Script para comparar el IPC entre diferentes regiones
 Genera gráficos comparativos usando pandas y plotly
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 import os
 
-# Crear carpeta para gráficos si no existe
-graficos_dir = 'graficos'
-os.makedirs(graficos_dir, exist_ok=True)
-
-# Cargar los datos del CSV
-print('Cargando datos del IPC desde INDEC...')
-df = pd.read_csv('data/serie_ipc_divisiones.csv', encoding='latin1', sep=';', decimal=',', na_values=['NA'])
+from ajuste_estacional import desestacionalizar
+from ipc_datos import leer_ipc
+
+# Ventana (en meses) de las estadísticas móviles entre regiones
+VENTANA = 12
+
+
+def cubo_regional(df, columna='v_m_IPC'):
+    """
+    Arma el arreglo Periodo × Region × Codigo de `columna` en una sola pasada.
+    Excluye Nacional, que es el agregado de las demás regiones.
+    Devuelve (cubo, periodos, regiones, codigos, descripciones).
+    """
+    datos = df[df['Region'] != 'Nacional']
+    regiones = sorted(datos['Region'].unique())
+    codigos = sorted(datos['Codigo'].unique())
+
+    tabla = datos.pivot_table(index='Periodo', columns=['Codigo', 'Region'], values=columna, aggfunc='first')
+    tabla = tabla.reindex(columns=pd.MultiIndex.from_product([codigos, regiones]))
+    cubo = tabla.to_numpy().reshape(len(tabla), len(codigos), len(regiones)).transpose(0, 2, 1)
+
+    # Etiqueta de cada código (B y S no tienen descripción en el CSV)
+    descripciones = datos.dropna(subset=['Descripcion']).groupby('Codigo')['Descripcion'].first()
+    descripciones = [descripciones.get(c, c) for c in codigos]
+    return cubo, tabla.index, regiones, codigos, descripciones
+
+
+def suma_movil(x, ventana):
+    """
+    Suma móvil sobre el eje 0 mediante sumas acumuladas (sin bucles por ventana).
+    Con menos períodos que la ventana devuelve todo NaN.
+    """
+    resultado = np.full(x.shape, np.nan)
+    if len(x) < ventana:
+        return resultado
+    acumulada = np.cumsum(x, axis=0)
+    resultado[ventana - 1] = acumulada[ventana - 1]
+    resultado[ventana:] = acumulada[ventana:] - acumulada[:-ventana]
+    return resultado
+
+
+def media_movil(x, ventana):
+    """Media móvil sobre el eje 0; NaN si la ventana no está completa."""
+    validos = ~np.isnan(x)
+    suma = suma_movil(np.where(validos, x, 0.0), ventana)
+    cantidad = suma_movil(validos.astype(float), ventana)
+    return np.where(cantidad == ventana, suma / np.where(cantidad > 0, cantidad, 1), np.nan)
+
+
+def dispersion_regional(cubo, ventana=VENTANA):
+    """
+    Dispersión entre regiones para cada período y código (cubo: T × R × D).
+    Devuelve (desvío, rango, desvío móvil, rango móvil), cada uno T × D.
+    """
+    validos = ~np.isnan(cubo)
+    hay_datos = validos.any(axis=1)
+    cubo_0 = np.where(validos, cubo, 0.0)
+
+    n = validos.sum(axis=1)
+    media = cubo_0.sum(axis=1) / np.maximum(n, 1)
+    desvio = np.sqrt(np.where(validos, (cubo - media[:, None, :]) ** 2, 0.0).sum(axis=1) / np.maximum(n, 1))
+    rango = np.where(validos, cubo, -np.inf).max(axis=1) - np.where(validos, cubo, np.inf).min(axis=1)
+
+    desvio = np.where(hay_datos, desvio, np.nan)
+    rango = np.where(hay_datos, rango, np.nan)
+    return desvio, rango, media_movil(desvio, ventana), media_movil(rango, ventana)
+
+
+def correlacion_movil(cubo, ventana=VENTANA):
+    """
+    Correlación móvil entre cada par de regiones para todos los códigos a la vez.
+    Devuelve un arreglo T × R × R × D (NaN si la ventana no está completa para el par).
+    """
+    validos = ~np.isnan(cubo)
+    x = np.where(validos, cubo, 0.0)
+    m = validos.astype(float)
+
+    # Productos por par (i, j): T × R × R × D
+    xi, xj = x[:, :, None, :], x[:, None, :, :]
+    mi, mj = m[:, :, None, :], m[:, None, :, :]
+
+    n = suma_movil(mi * mj, ventana)
+    sx = suma_movil(xi * mj, ventana)
+    sy = suma_movil(xj * mi, ventana)
+    sxx = suma_movil(xi * xi * mj, ventana)
+    syy = suma_movil(xj * xj * mi, ventana)
+    sxy = suma_movil(xi * xj, ventana)
+
+    covarianza = n * sxy - sx * sy
+    varianza = (n * sxx - sx ** 2) * (n * syy - sy ** 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correlacion = covarianza / np.sqrt(varianza)
+    return np.where((n == ventana) & (varianza > 0), correlacion, np.nan)
+
+
+def comparar_regiones(df, graficos_dir='graficos'):
+    """
+    Genera los 10 gráficos comparativos entre regiones: 7 de NIVEL GENERAL y 3 que
+    usan todas las divisiones (dispersión, correlación móvil y brecha por división).
+    """
+    os.makedirs(graficos_dir, exist_ok=True)
+
+    # Filtrar solo NIVEL GENERAL
+    df_nivel_general = df[df['Descripcion'] == 'NIVEL GENERAL'].copy()
+
+    print('=' * 80)
+    print('COMPARACIÓN DEL IPC ENTRE REGIONES')
+    print('=' * 80)
+    print(f'\nRegiones disponibles: {", ".join(sorted(df_nivel_general["Region"].unique()))}')
+    print(f'Períodos analizados: {df_nivel_general["Periodo"].min().strftime("%Y-%m")} - {df_nivel_general["Periodo"].max().strftime("%Y-%m")}')
+
+    # Gráfico 1: Evolución del Índice - Comparación entre Regiones
+    print('\nGenerando gráfico 1: Evolución del Índice por Región...')
+    fig1 = go.Figure()
+
+    regiones = sorted(df_nivel_general['Region'].unique())
+    colores = px.colors.qualitative.Set2
+
+    for idx, region in enumerate(regiones):
+        datos_region = df_nivel_general[df_nivel_general['Region'] == region].sort_values('Periodo')
+
+        fig1.add_trace(go.Scatter(
+            x=datos_region['Periodo'],
+            y=datos_region['Indice_IPC'],
+            mode='lines',
+            name=region,
+            line=dict(width=3 if region == 'Nacional' else 2),
+            visible=True if region in ['Nacional', 'GBA'] else 'legendonly'
+        ))
+
+    fig1.update_layout(
+        title='IPC - Comparación del Índice entre Regiones',
+        xaxis_title='Período',
+        yaxis_title='Índice (Base Dic 2016 = 100)',
+        hovermode='x unified',
+        legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
+        height=600,
+        template='plotly_white'
+    )
+
+    output_file = f'{graficos_dir}/ipc_comparacion_indice.html'
+    fig1.write_html(output_file)
+    print(f'✓ Gráfico 1 generado: {output_file}')
+
+    # Gráfico 2: Variación Mensual - Comparación entre Regiones
+    print('Generando gráfico 2: Variación Mensual por Región...')
+    fig2 = go.Figure()
+
+    for idx, region in enumerate(regiones):
+        datos_region = df_nivel_general[df_nivel_general['Region'] == region].sort_values('Periodo')
+
+        fig2.add_trace(go.Scatter(
+            x=datos_region['Periodo'],
+            y=datos_region['v_m_IPC'],
+            mode='lines',
+            name=region,
+            line=dict(width=3 if region == 'Nacional' else 2),
+            visible=True if region in ['Nacional', 'GBA'] else 'legendonly'
+        ))
+
+    fig2.update_layout(
+        title='IPC - Comparación de Variación Mensual entre Regiones',
+        xaxis_title='Período',
+        yaxis_title='Variación Mensual (%)',
+        hovermode='x unified',
+        legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
+        height=600,
+        template='plotly_white'
+    )
+
+    output_file = f'{graficos_dir}/ipc_comparacion_variacion_mensual.html'
+    fig2.write_html(output_file)
+    print(f'✓ Gráfico 2 generado: {output_file}')
+
+    # Gráfico 3: Variación Interanual - Comparación entre Regiones
+    print('Generando gráfico 3: Variación Interanual por Región...')
+    fig3 = go.Figure()
+
+    for idx, region in enumerate(regiones):
+        datos_region = df_nivel_general[df_nivel_general['Region'] == region].sort_values('Periodo')
+
+        fig3.add_trace(go.Scatter(
+            x=datos_region['Periodo'],
+            y=datos_region['v_i_a_IPC'],
+            mode='lines',
+            name=region,
+            line=dict(width=3 if region == 'Nacional' else 2),
+            visible=True if region in ['Nacional', 'GBA'] else 'legendonly'
+        ))
+
+    fig3.update_layout(
+        title='IPC - Comparación de Variación Interanual entre Regiones',
+        xaxis_title='Período',
+        yaxis_title='Variación Interanual (%)',
+        hovermode='x unified',
+        legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
+        height=600,
+        template='plotly_white'
+    )
+
+    output_file = f'{graficos_dir}/ipc_comparacion_variacion_interanual.html'
+    fig3.write_html(output_file)
+    print(f'✓ Gráfico 3 generado: {output_file}')
+
+    # Gráfico 4: Inflación Acumulada - Comparación entre Regiones
+    print('Generando gráfico 4: Inflación Acumulada por Región...')
+    fig4 = go.Figure()
+
+    for idx, region in enumerate(regiones):
+        datos_region = df_nivel_general[df_nivel_general['Region'] == region].sort_values('Periodo')
+
+        # Calcular inflación acumulada desde la base
+        datos_region = datos_region.copy()
+        datos_region['inflacion_acumulada'] = ((datos_region['Indice_IPC'] - 100) / 100) * 100
+
+        fig4.add_trace(go.Scatter(
+            x=datos_region['Periodo'],
+            y=datos_region['inflacion_acumulada'],
+            mode='lines',
+            name=region,
+            line=dict(width=3 if region == 'Nacional' else 2),
+            visible=True if region in ['Nacional', 'GBA'] else 'legendonly'
+        ))
+
+    fig4.update_layout(
+        title='IPC - Comparación de Inflación Acumulada entre Regiones',
+        xaxis_title='Período',
+        yaxis_title='Inflación Acumulada desde Dic 2016 (%)',
+        hovermode='x unified',
+        legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
+        height=600,
+        template='plotly_white'
+    )
+
+    output_file = f'{graficos_dir}/ipc_comparacion_acumulado.html'
+    fig4.write_html(output_file)
+    print(f'✓ Gráfico 4 generado: {output_file}')
+
+    # Gráfico 5: Ranking de Inflación por Región (últimos 12 meses)
+    print('Generando gráfico 5: Ranking de Inflación por Región...')
+
+    # Obtener últimos 12 meses
+    fecha_max = df_nivel_general['Periodo'].max()
+    fecha_inicio = fecha_max - pd.DateOffset(months=11)
+    df_ultimos_12 = df_nivel_general[df_nivel_general['Periodo'] >= fecha_inicio].copy()
+
+    # Calcular inflación acumulada en los últimos 12 meses
+    inflacion_por_region = []
+    for region in regiones:
+        datos = df_ultimos_12[df_ultimos_12['Region'] == region].sort_values('Periodo')
+        if len(datos) >= 2:
+            indice_inicial = datos.iloc[0]['Indice_IPC']
+            indice_final = datos.iloc[-1]['Indice_IPC']
+            inflacion = ((indice_final / indice_inicial) - 1) * 100
+            inflacion_por_region.append({'Region': region, 'Inflacion_12m': inflacion})
+
+    df_ranking = pd.DataFrame(inflacion_por_region).sort_values('Inflacion_12m', ascending=True)
+
+    fig5 = go.Figure(go.Bar(
+        x=df_ranking['Inflacion_12m'],
+        y=df_ranking['Region'],
+        orientation='h',
+        text=[f'{val:.1f}%' for val in df_ranking['Inflacion_12m']],
+        textposition='outside',
+        marker_color='steelblue'
+    ))
 
-# Limpiar nombres de columnas
-df.columns = df.columns.str.strip()
+    fig5.update_layout(
+        title='IPC - Ranking de Inflación por Región (Últimos 12 meses)',
+        xaxis_title='Inflación Acumulada 12 meses (%)',
+        yaxis_title='Región',
+        height=500,
+        template='plotly_white'
+    )
+
+    output_file = f'{graficos_dir}/ipc_comparacion_ranking.html'
+    fig5.write_html(output_file)
+    print(f'✓ Gráfico 5 generado: {output_file}')
+
+    # Gráfico 6: Heatmap de Variación Mensual por Región (últimos 24 meses)
+    print('Generando gráfico 6: Heatmap de Variación Mensual por Región...')
+
+    # Obtener últimos 24 meses
+    fecha_inicio_24 = fecha_max - pd.DateOffset(months=23)
+    df_ultimos_24 = df_nivel_general[df_nivel_general['Periodo'] >= fecha_inicio_24].copy()
+
+    # Crear pivot table
+    pivot_heatmap = df_ultimos_24.pivot_table(
+        values='v_m_IPC',
+        index='Region',
+        columns='year_month',
+        aggfunc='first'
+    )
+
+    fig6 = go.Figure(data=go.Heatmap(
+        z=pivot_heatmap.values,
+        x=pivot_heatmap.columns,
+        y=pivot_heatmap.index,
+        colorscale='RdYlGn_r',
+        text=pivot_heatmap.values,
+        texttemplate='%{text:.1f}%',
+        textfont={'size': 9},
+        colorbar=dict(title='Var. Mensual (%)')
+    ))
 
-# Convertir período a datetime
-df['Periodo'] = pd.to_datetime(df['Periodo'].astype(str), format='%Y%m')
-df['year_month'] = df['Periodo'].dt.strftime('%Y-%m')
+    fig6.update_layout(
+        title='IPC - Mapa de Calor Variación Mensual por Región (Últimos 24 meses)',
+        xaxis_title='Período',
+        yaxis_title='Región',
+        height=500,
+        template='plotly_white'
+    )
+
+    output_file = f'{graficos_dir}/ipc_comparacion_heatmap.html'
+    fig6.write_html(output_file)
+    print(f'✓ Gráfico 6 generado: {output_file}')
+    cantidad_graficos = 6
+
+    # Gráfico 7: Variación Mensual Desestacionalizada - Comparación entre Regiones
+    if 'v_m_IPC_desest' in df_nivel_general.columns and df_nivel_general['v_m_IPC_desest'].notna().any():
+        print('Generando gráfico 7: Variación Mensual Desestacionalizada por Región...')
+        fig7 = go.Figure()
+
+        for idx, region in enumerate(regiones):
+            datos_region = df_nivel_general[df_nivel_general['Region'] == region].sort_values('Periodo')
+
+            fig7.add_trace(go.Scatter(
+                x=datos_region['Periodo'],
+                y=datos_region['v_m_IPC_desest'],
+                mode='lines',
+                name=region,
+                line=dict(width=3 if region == 'Nacional' else 2),
+                visible=True if region in ['Nacional', 'GBA'] else 'legendonly'
+            ))
+
+        fig7.update_layout(
+            title='IPC - Comparación de Variación Mensual Desestacionalizada entre Regiones',
+            xaxis_title='Período',
+            yaxis_title='Variación Mensual sin Estacionalidad (%)',
+            hovermode='x unified',
+            legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
+            height=600,
+            template='plotly_white'
+        )
+
+        output_file = f'{graficos_dir}/ipc_comparacion_desestacionalizado.html'
+        fig7.write_html(output_file)
+        print(f'✓ Gráfico 7 generado: {output_file}')
+        cantidad_graficos += 1
+
+    # Estadísticas entre regiones para todas las divisiones y categorías en una pasada
+    cubo, periodos, regiones_cubo, codigos, descripciones = cubo_regional(df)
+    desvio, rango, desvio_movil, rango_movil = dispersion_regional(cubo)
+    correlacion = correlacion_movil(cubo)
+    indice_ng = codigos.index('0') if '0' in codigos else 0
+
+    # Gráfico 8: Dispersión entre Regiones (móvil 12 meses)
+    print(f'Generando gráfico 8: Dispersión entre Regiones ({VENTANA} meses)...')
+    fig8 = go.Figure()
+
+    for d, descripcion in enumerate(descripciones):
+        fig8.add_trace(go.Scatter(
+            x=periodos,
+            y=desvio_movil[:, d],
+            mode='lines',
+            name=f'{descripcion} - Desvío estándar',
+            line=dict(width=2 if d == indice_ng else 1),
+            visible=True if d == indice_ng else 'legendonly'
+        ))
+        fig8.add_trace(go.Scatter(
+            x=periodos,
+            y=rango_movil[:, d],
+            mode='lines',
+            name=f'{descripcion} - Rango (máx - mín)',
+            line=dict(width=2 if d == indice_ng else 1, dash='dot'),
+            visible=True if d == indice_ng else 'legendonly'
+        ))
+
+    fig8.update_layout(
+        title=f'IPC - Dispersión de la Variación Mensual entre Regiones (media móvil {VENTANA} meses, sin Nacional)',
+        xaxis_title='Período',
+        yaxis_title='Puntos porcentuales',
+        hovermode='x unified',
+        legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
+        height=600,
+        template='plotly_white'
+    )
+
+    output_file = f'{graficos_dir}/ipc_comparacion_dispersion.html'
+    fig8.write_html(output_file)
+    print(f'✓ Gráfico 8 generado: {output_file}')
+
+    # Gráfico 9: Correlación móvil entre Regiones (NIVEL GENERAL, con selector de período)
+    print(f'Generando gráfico 9: Correlación entre Regiones ({VENTANA} meses)...')
+    correlacion_ng = correlacion[:, :, :, indice_ng]
+    disponibles = [t for t in range(len(periodos)) if not np.isnan(correlacion_ng[t]).all()]
+    if not disponibles:
+        # Menos de VENTANA períodos con datos: no hay ninguna ventana completa
+        print(f'Se omite el gráfico 9: no hay {VENTANA} períodos completos para correlacionar')
+    else:
+        fig9 = go.Figure(data=go.Heatmap(
+            z=correlacion_ng[disponibles[-1]],
+            x=regiones_cubo,
+            y=regiones_cubo,
+            zmin=-1,
+            zmax=1,
+            colorscale='RdBu',
+            texttemplate='%{z:.2f}',
+            textfont={'size': 10},
+            colorbar=dict(title='Correlación')
+        ))
+
+        fig9.update_layout(
+            title=f'IPC - Correlación Móvil de la Variación Mensual entre Regiones ({VENTANA} meses)',
+            height=650,
+            template='plotly_white',
+            sliders=[dict(
+                active=len(disponibles) - 1,
+                currentvalue=dict(prefix='Ventana hasta: '),
+                steps=[
+                    dict(
+                        label=periodos[t].strftime('%Y-%m'),
+                        method='restyle',
+                        args=[{'z': [correlacion_ng[t]]}]
+                    )
+                    for t in disponibles
+                ]
+            )]
+        )
+
+        output_file = f'{graficos_dir}/ipc_comparacion_correlacion.html'
+        fig9.write_html(output_file)
+        print(f'✓ Gráfico 9 generado: {output_file}')
+        cantidad_graficos += 1
+
+    # Gráfico 10: Brecha regional por división (últimos 24 meses)
+    print('Generando gráfico 10: Brecha Regional por División...')
+    ultimos_24 = periodos >= fecha_inicio_24
+
+    fig10 = go.Figure(data=go.Heatmap(
+        z=rango[ultimos_24].T,
+        x=periodos[ultimos_24].strftime('%Y-%m'),
+        y=descripciones,
+        colorscale='YlOrRd',
+        text=rango[ultimos_24].T,
+        texttemplate='%{text:.1f}',
+        textfont={'size': 8},
+        colorbar=dict(title='Máx - Mín (p.p.)')
+    ))
 
-# Filtrar solo NIVEL GENERAL
-df_nivel_general = df[df['Descripcion'] == 'NIVEL GENERAL'].copy()
+    fig10.update_layout(
+        title='IPC - Brecha entre Regiones de la Variación Mensual por División (Últimos 24 meses)',
+        xaxis_title='Período',
+        yaxis_title='División',
+        height=700,
+        template='plotly_white'
+    )
 
-print('=' * 80)
-print('COMPARACIÓN DEL IPC ENTRE REGIONES')
-print('=' * 80)
-print(f'\nRegiones disponibles: {", ".join(sorted(df_nivel_general["Region"].unique()))}')
-print(f'Períodos analizados: {df_nivel_general["Periodo"].min().strftime("%Y-%m")} - {df_nivel_general["Periodo"].max().strftime("%Y-%m")}')
+    output_file = f'{graficos_dir}/ipc_comparacion_brecha_divisiones.html'
+    fig10.write_html(output_file)
+    print(f'✓ Gráfico 10 generado: {output_file}')
+    cantidad_graficos += 2
 
-# Gráfico 1: Evolución del Índice - Comparación entre Regiones
-print('\nGenerando gráfico 1: Evolución del Índice por Región...')
-fig1 = go.Figure()
+    # Mostrar estadísticas comparativas
+    print('\n' + '=' * 80)
+    print('ESTADÍSTICAS COMPARATIVAS (Octubre 2025)')
+    print('=' * 80)
 
-regiones = sorted(df_nivel_general['Region'].unique())
-colores = px.colors.qualitative.Set2
+    datos_actuales = df_nivel_general[df_nivel_general['Periodo'] == fecha_max].sort_values('Indice_IPC', ascending=False)
 
-for idx, region in enumerate(regiones):
-    datos_region = df_nivel_general[df_nivel_general['Region'] == region].sort_values('Periodo')
+    print('\nÍndice Actual por Región:')
+    for _, row in datos_actuales.iterrows():
+        print(f"  {row['Region']:12s}: Índice {row['Indice_IPC']:8.2f} | Var.Mensual {row['v_m_IPC']:5.2f}% | Var.Interanual {row['v_i_a_IPC']:5.2f}%")
 
-    fig1.add_trace(go.Scatter(
-        x=datos_region['Periodo'],
-        y=datos_region['Indice_IPC'],
-        mode='lines',
-        name=region,
-        line=dict(width=3 if region == 'Nacional' else 2),
-        visible=True if region in ['Nacional', 'GBA'] else 'legendonly'
-    ))
+    print('\n' + '=' * 80)
+    print('✓ Análisis comparativo completado exitosamente!')
+    print(f'Se generaron {cantidad_graficos} archivos HTML con gráficos comparativos en {graficos_dir}/')
+    print('=' * 80)
 
-fig1.update_layout(
-    title='IPC - Comparación del Índice entre Regiones',
-    xaxis_title='Período',
-    yaxis_title='Índice (Base Dic 2016 = 100)',
-    hovermode='x unified',
-    legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
-    height=600,
-    template='plotly_white'
-)
-
-output_file = f'{graficos_dir}/ipc_comparacion_indice.html'
-fig1.write_html(output_file)
-print(f'✓ Gráfico 1 generado: {output_file}')
-
-# Gráfico 2: Variación Mensual - Comparación entre Regiones
-print('Generando gráfico 2: Variación Mensual por Región...')
-fig2 = go.Figure()
-
-for idx, region in enumerate(regiones):
-    datos_region = df_nivel_general[df_nivel_general['Region'] == region].sort_values('Periodo')
-
-    fig2.add_trace(go.Scatter(
-        x=datos_region['Periodo'],
-        y=datos_region['v_m_IPC'],
-        mode='lines',
-        name=region,
-        line=dict(width=3 if region == 'Nacional' else 2),
-        visible=True if region in ['Nacional', 'GBA'] else 'legendonly'
-    ))
 
-fig2.update_layout(
-    title='IPC - Comparación de Variación Mensual entre Regiones',
-    xaxis_title='Período',
-    yaxis_title='Variación Mensual (%)',
-    hovermode='x unified',
-    legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
-    height=600,
-    template='plotly_white'
-)
-
-output_file = f'{graficos_dir}/ipc_comparacion_variacion_mensual.html'
-fig2.write_html(output_file)
-print(f'✓ Gráfico 2 generado: {output_file}')
-
-# Gráfico 3: Variación Interanual - Comparación entre Regiones
-print('Generando gráfico 3: Variación Interanual por Región...')
-fig3 = go.Figure()
-
-for idx, region in enumerate(regiones):
-    datos_region = df_nivel_general[df_nivel_general['Region'] == region].sort_values('Periodo')
-
-    fig3.add_trace(go.Scatter(
-        x=datos_region['Periodo'],
-        y=datos_region['v_i_a_IPC'],
-        mode='lines',
-        name=region,
-        line=dict(width=3 if region == 'Nacional' else 2),
-        visible=True if region in ['Nacional', 'GBA'] else 'legendonly'
-    ))
+if __name__ == '__main__':
+    # Cargar los datos del CSV
+    print('Cargando datos del IPC desde INDEC...')
+    df = leer_ipc()
 
-fig3.update_layout(
-    title='IPC - Comparación de Variación Interanual entre Regiones',
-    xaxis_title='Período',
-    yaxis_title='Variación Interanual (%)',
-    hovermode='x unified',
-    legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
-    height=600,
-    template='plotly_white'
-)
-
-output_file = f'{graficos_dir}/ipc_comparacion_variacion_interanual.html'
-fig3.write_html(output_file)
-print(f'✓ Gráfico 3 generado: {output_file}')
-
-# Gráfico 4: Inflación Acumulada - Comparación entre Regiones
-print('Generando gráfico 4: Inflación Acumulada por Región...')
-fig4 = go.Figure()
-
-for idx, region in enumerate(regiones):
-    datos_region = df_nivel_general[df_nivel_general['Region'] == region].sort_values('Periodo')
-
-    # Calcular inflación acumulada desde la base
-    datos_region = datos_region.copy()
-    datos_region['inflacion_acumulada'] = ((datos_region['Indice_IPC'] - 100) / 100) * 100
-
-    fig4.add_trace(go.Scatter(
-        x=datos_region['Periodo'],
-        y=datos_region['inflacion_acumulada'],
-        mode='lines',
-        name=region,
-        line=dict(width=3 if region == 'Nacional' else 2),
-        visible=True if region in ['Nacional', 'GBA'] else 'legendonly'
-    ))
+    # Ajuste estacional de todas las series (usa la caché si no cambiaron)
+    print('Desestacionalizando series...')
+    df['v_m_IPC_desest'], _ = desestacionalizar(df)
 
-fig4.update_layout(
-    title='IPC - Comparación de Inflación Acumulada entre Regiones',
-    xaxis_title='Período',
-    yaxis_title='Inflación Acumulada desde Dic 2016 (%)',
-    hovermode='x unified',
-    legend=dict(yanchor='top', y=0.99, xanchor='left', x=0.01),
-    height=600,
-    template='plotly_white'
-)
-
-output_file = f'{graficos_dir}/ipc_comparacion_acumulado.html'
-fig4.write_html(output_file)
-print(f'✓ Gráfico 4 generado: {output_file}')
-
-# Gráfico 5: Ranking de Inflación por Región (últimos 12 meses)
-print('Generando gráfico 5: Ranking de Inflación por Región...')
-
-# Obtener últimos 12 meses
-fecha_max = df_nivel_general['Periodo'].max()
-fecha_inicio = fecha_max - pd.DateOffset(months=11)
-df_ultimos_12 = df_nivel_general[df_nivel_general['Periodo'] >= fecha_inicio].copy()
-
-# Calcular inflación acumulada en los últimos 12 meses
-inflacion_por_region = []
-for region in regiones:
-    datos = df_ultimos_12[df_ultimos_12['Region'] == region].sort_values('Periodo')
-    if len(datos) >= 2:
-        indice_inicial = datos.iloc[0]['Indice_IPC']
-        indice_final = datos.iloc[-1]['Indice_IPC']
-        inflacion = ((indice_final / indice_inicial) - 1) * 100
-        inflacion_por_region.append({'Region': region, 'Inflacion_12m': inflacion})
-
-df_ranking = pd.DataFrame(inflacion_por_region).sort_values('Inflacion_12m', ascending=True)
-
-fig5 = go.Figure(go.Bar(
-    x=df_ranking['Inflacion_12m'],
-    y=df_ranking['Region'],
-    orientation='h',
-    text=[f'{val:.1f}%' for val in df_ranking['Inflacion_12m']],
-    textposition='outside',
-    marker_color='steelblue'
-))
-
-fig5.update_layout(
-    title='IPC - Ranking de Inflación por Región (Últimos 12 meses)',
-    xaxis_title='Inflación Acumulada 12 meses (%)',
-    yaxis_title='Región',
-    height=500,
-    template='plotly_white'
-)
-
-output_file = f'{graficos_dir}/ipc_comparacion_ranking.html'
-fig5.write_html(output_file)
-print(f'✓ Gráfico 5 generado: {output_file}')
-
-# Gráfico 6: Heatmap de Variación Mensual por Región (últimos 24 meses)
-print('Generando gráfico 6: Heatmap de Variación Mensual por Región...')
-
-# Obtener últimos 24 meses
-fecha_inicio_24 = fecha_max - pd.DateOffset(months=23)
-df_ultimos_24 = df_nivel_general[df_nivel_general['Periodo'] >= fecha_inicio_24].copy()
-
-# Crear pivot table
-pivot_heatmap = df_ultimos_24.pivot_table(
-    values='v_m_IPC',
-    index='Region',
-    columns='year_month',
-    aggfunc='first'
-)
-
-fig6 = go.Figure(data=go.Heatmap(
-    z=pivot_heatmap.values,
-    x=pivot_heatmap.columns,
-    y=pivot_heatmap.index,
-    colorscale='RdYlGn_r',
-    text=pivot_heatmap.values,
-    texttemplate='%{text:.1f}%',
-    textfont={'size': 9},
-    colorbar=dict(title='Var. Mensual (%)')
-))
-
-fig6.update_layout(
-    title='IPC - Mapa de Calor Variación Mensual por Región (Últimos 24 meses)',
-    xaxis_title='Período',
-    yaxis_title='Región',
-    height=500,
-    template='plotly_white'
-)
-
-output_file = f'{graficos_dir}/ipc_comparacion_heatmap.html'
-fig6.write_html(output_file)
-print(f'✓ Gráfico 6 generado: {output_file}')
-
-# Mostrar estadísticas comparativas
-print('\n' + '=' * 80)
-print('ESTADÍSTICAS COMPARATIVAS (Octubre 2025)')
-print('=' * 80)
-
-datos_actuales = df_nivel_general[df_nivel_general['Periodo'] == fecha_max].sort_values('Indice_IPC', ascending=False)
-
-print('\nÍndice Actual por Región:')
-for _, row in datos_actuales.iterrows():
-    print(f"  {row['Region']:12s}: Índice {row['Indice_IPC']:8.2f} | Var.Mensual {row['v_m_IPC']:5.2f}% | Var.Interanual {row['v_i_a_IPC']:5.2f}%")
-
-print('\n' + '=' * 80)
-print('✓ Análisis comparativo completado exitosamente!')
-print(f'Se generaron 6 archivos HTML con gráficos comparativos en {graficos_dir}/')
-print('=' * 80)
+    comparar_regiones(df)
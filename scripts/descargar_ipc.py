@@ -0,0 +1,182 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = [
+#   "httpx",
+# ]
+# ///
+"""
+Script para descargar las series del INDEC de forma concurrente y condicional
+Usa ETag/Last-Modified para evitar descargas sin cambios y reanuda descargas parciales
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+
+import httpx
+
+URL_BASE = 'https://www.indec.gob.ar/ftp/cuadros/economia'
+
+# Archivos a descargar: ruta local -> nombre en el servidor del INDEC
+FUENTES = {
+    'data/serie_ipc_divisiones.csv': 'serie_ipc_divisiones.csv',
+}
+
+# ETag y Last-Modified de la última descarga de cada archivo
+RUTA_METADATOS = 'data/descargas.json'
+
+TAMANO_BLOQUE = 64 * 1024
+
+
+def cargar_metadatos(ruta=RUTA_METADATOS):
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def guardar_metadatos(metadatos, ruta=RUTA_METADATOS):
+    tmp = f'{ruta}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(metadatos, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp, ruta)
+
+
+def hash_archivo(ruta):
+    h = hashlib.sha256()
+    try:
+        with open(ruta, 'rb') as f:
+            for bloque in iter(lambda: f.read(TAMANO_BLOQUE), b''):
+                h.update(bloque)
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+
+async def descargar(client, url, ruta, meta):
+    """
+    Descarga `url` en `ruta` si cambió respecto de `meta`.
+    Devuelve (cambió, metadatos nuevos, mensaje).
+    """
+    headers = {}
+    parcial = f'{ruta}.part'
+
+    # Pedido condicional solo si el archivo local existe
+    if os.path.exists(ruta):
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    # Reanudar una descarga parcial previa de la misma versión del archivo
+    offset = os.path.getsize(parcial) if os.path.exists(parcial) else 0
+    if offset and meta.get('parcial_validador'):
+        headers['Range'] = f'bytes={offset}-'
+        headers['If-Range'] = meta['parcial_validador']
+    else:
+        offset = 0
+
+    async with client.stream('GET', url, headers=headers) as respuesta:
+        if respuesta.status_code == 304:
+            return False, meta, 'sin cambios (304)'
+        respuesta.raise_for_status()
+
+        validador = respuesta.headers.get('etag') or respuesta.headers.get('last-modified')
+        nuevo_meta = {
+            'etag': respuesta.headers.get('etag'),
+            'last_modified': respuesta.headers.get('last-modified'),
+            'parcial_validador': validador,
+        }
+
+        # 206: el servidor aceptó el rango; 200: se descarga desde el principio
+        modo = 'ab' if respuesta.status_code == 206 else 'wb'
+        if modo == 'wb':
+            offset = 0
+        try:
+            with open(parcial, modo) as f:
+                async for bloque in respuesta.aiter_bytes(TAMANO_BLOQUE):
+                    f.write(bloque)
+        except (httpx.HTTPError, asyncio.CancelledError):
+            # Se conserva el .part y su validador para reanudar la próxima vez
+            meta['parcial_validador'] = validador
+            raise
+
+    nuevo_meta.pop('parcial_validador')
+    cambio = hash_archivo(parcial) != hash_archivo(ruta)
+
+    # Reemplazo atómico: los lectores nunca ven un archivo a medio escribir
+    os.replace(parcial, ruta)
+    mensaje = 'actualizado' if cambio else 'descargado sin cambios en el contenido'
+    if offset:
+        mensaje += f' (reanudado desde {offset} bytes)'
+    return cambio, nuevo_meta, mensaje
+
+
+async def descargar_todo(fuentes, url_base, metadatos, max_conexiones=4, timeout=60):
+    """Descarga todas las fuentes en paralelo reutilizando conexiones."""
+    limites = httpx.Limits(max_connections=max_conexiones, max_keepalive_connections=max_conexiones)
+    async with httpx.AsyncClient(limits=limites, timeout=timeout, follow_redirects=True) as client:
+        tareas = {
+            ruta: descargar(client, f'{url_base.rstrip("/")}/{nombre}', ruta, metadatos.setdefault(ruta, {}))
+            for ruta, nombre in fuentes.items()
+        }
+        resultados = await asyncio.gather(*tareas.values(), return_exceptions=True)
+    return dict(zip(tareas.keys(), resultados))
+
+
+if __name__ == '__main__':
+    # Configurar argumentos de línea de comandos
+    parser = argparse.ArgumentParser(
+        description='Descarga las series del INDEC de forma concurrente y condicional'
+    )
+    parser.add_argument(
+        '--url-base',
+        type=str,
+        default=os.environ.get('INDEC_URL_BASE', URL_BASE),
+        help='URL base de los archivos (por ejemplo, la del servidor local de pruebas)'
+    )
+    parser.add_argument(
+        '--max-conexiones',
+        type=int,
+        default=4,
+        help='Máximo de conexiones simultáneas (default: 4)'
+    )
+
+    args = parser.parse_args()
+
+    print(f'Descargando {len(FUENTES)} archivo(s) desde {args.url_base}...')
+    inicio = time.perf_counter()
+    metadatos = cargar_metadatos()
+    resultados = asyncio.run(
+        descargar_todo(FUENTES, args.url_base, metadatos, args.max_conexiones)
+    )
+
+    cambios = []
+    errores = []
+    for ruta, resultado in resultados.items():
+        if isinstance(resultado, Exception):
+            errores.append(ruta)
+            print(f'✗ {ruta}: {resultado}')
+            continue
+        cambio, metadatos[ruta], mensaje = resultado
+        if cambio:
+            cambios.append(ruta)
+        print(f'✓ {ruta}: {mensaje}')
+
+    guardar_metadatos(metadatos)
+    print(f'\nDescarga completada en {time.perf_counter() - inicio:.2f}s '
+          f'({len(cambios)} con cambios, {len(errores)} con errores)')
+
+    # Exponer el resultado a GitHub Actions para saltear el procesamiento
+    if os.environ.get('GITHUB_OUTPUT'):
+        with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
+            f.write(f'changed={"true" if cambios else "false"}\n')
+
+    if errores:
+        sys.exit(1)
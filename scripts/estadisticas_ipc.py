@@ -0,0 +1,314 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = [
+#   "pandas",
+# ]
+# ///
+"""
+Script para mantener la tabla materializada de estadísticas del IPC
+Guarda una fila por serie Region × Codigo y la actualiza solo con los períodos nuevos
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import math
+import os
+import statistics
+import time
+
+import pandas as pd
+
+from ipc_datos import leer_ipc
+
+# Se versiona junto con los datos para que cada actualización mensual parta del
+# estado anterior y solo incorpore los períodos nuevos
+RUTA_ESTADISTICAS = 'data/estadisticas_ipc.json'
+
+# Variación mensual (%) a partir de la cual se cuenta una racha
+UMBRAL_RACHA = 2.0
+
+PERCENTILES = [10, 50, 90]
+
+# Campos internos que permiten la actualización incremental (no se publican)
+CAMPOS_ESTADO = ['v_m_ordenados', 'ultimos_12', 'huella']
+
+# Columnas cuyo contenido identifica la versión publicada de cada período
+COLUMNAS_HUELLA = ['Periodo', 'Indice_IPC', 'v_m_IPC', 'v_i_a_IPC']
+
+# Meses guardados de cada serie que se comparan para detectar revisiones. Un cambio
+# de base altera todos los índices y siempre se detecta; una revisión más antigua
+# que esta ventana requiere --reconstruir
+VENTANA_REVISION = 12
+
+
+def percentil(ordenados, q):
+    """Percentil q (0-100) con interpolación lineal sobre una lista ordenada."""
+    if not ordenados:
+        return None
+    posicion = (len(ordenados) - 1) * q / 100
+    inferior = math.floor(posicion)
+    superior = math.ceil(posicion)
+    fraccion = posicion - inferior
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * fraccion
+
+
+def _valor(x):
+    return None if pd.isna(x) else float(x)
+
+
+class EstadisticasIPC:
+    """Tabla de estadísticas por serie Region × Codigo, actualizable por períodos."""
+
+    def __init__(self, umbral=UMBRAL_RACHA):
+        self.umbral = umbral
+        self.series = {}
+
+    def _nueva_serie(self, fila):
+        return {
+            'region': fila['Region'],
+            'codigo': fila['Codigo'],
+            'descripcion': fila['Descripcion'] if isinstance(fila['Descripcion'], str) else fila['Codigo'],
+            'periodo_inicial': fila['Periodo'].strftime('%Y-%m'),
+            'indice_inicial': _valor(fila['Indice_IPC']),
+            'n_periodos': 0,
+            'racha_actual': 0,
+            'racha_maxima': 0,
+            'racha_maxima_hasta': None,
+            'inflacion_acumulada': None,
+            'v_m_ordenados': [],
+            'ultimos_12': [],
+        }
+
+    def _agregar_periodo(self, estado, fila):
+        """Incorpora un período a la serie en O(1) salvo la inserción ordenada."""
+        estado['n_periodos'] += 1
+        estado['ultimo_periodo'] = fila['Periodo'].strftime('%Y-%m')
+        estado['indice'] = _valor(fila['Indice_IPC'])
+        estado['v_m'] = _valor(fila['v_m_IPC'])
+        estado['v_i_a'] = _valor(fila['v_i_a_IPC'])
+
+        if estado['indice_inicial'] is None:
+            estado['indice_inicial'] = estado['indice']
+        if estado['indice'] is not None and estado['indice_inicial']:
+            estado['inflacion_acumulada'] = (estado['indice'] / estado['indice_inicial'] - 1) * 100
+
+        v_m = estado['v_m']
+        if v_m is None:
+            estado['racha_actual'] = 0
+            return
+
+        bisect.insort(estado['v_m_ordenados'], v_m)
+        estado['ultimos_12'] = (estado['ultimos_12'] + [v_m])[-12:]
+
+        if v_m > self.umbral:
+            estado['racha_actual'] += 1
+            if estado['racha_actual'] > estado['racha_maxima']:
+                estado['racha_maxima'] = estado['racha_actual']
+                estado['racha_maxima_hasta'] = estado['ultimo_periodo']
+        else:
+            estado['racha_actual'] = 0
+
+    def _resumir(self, estado):
+        """Recalcula los campos derivados de la lista ordenada y la ventana de 12 meses."""
+        ordenados = estado['v_m_ordenados']
+        estado['v_m_min'] = ordenados[0] if ordenados else None
+        estado['v_m_max'] = ordenados[-1] if ordenados else None
+        for q in PERCENTILES:
+            estado[f'v_m_p{q}'] = percentil(ordenados, q)
+        ultimos = estado['ultimos_12']
+        estado['volatilidad_12m'] = statistics.stdev(ultimos) if len(ultimos) == 12 else None
+
+    def actualizar(self, df):
+        """
+        Incorpora las filas con períodos posteriores al último de cada serie.
+        Devuelve la cantidad de períodos agregados.
+        """
+        agregados = 0
+        modificadas = set()
+        for fila in df.sort_values('Periodo').to_dict('records'):
+            clave = (fila['Region'], fila['Codigo'])
+            estado = self.series.get(clave)
+            if estado is None:
+                estado = self.series[clave] = self._nueva_serie(fila)
+            elif fila['Periodo'].strftime('%Y-%m') <= estado['ultimo_periodo']:
+                continue
+            self._agregar_periodo(estado, fila)
+            modificadas.add(clave)
+            agregados += 1
+
+        for clave in modificadas:
+            self._resumir(self.series[clave])
+        return agregados
+
+    def reconstruir(self, df, claves=None):
+        """Recalcula desde cero las series indicadas (o todas) a partir de df."""
+        if claves is None:
+            self.series = {}
+        else:
+            for clave in claves:
+                self.series.pop(clave, None)
+            indice = pd.MultiIndex.from_frame(df[['Region', 'Codigo']])
+            df = df[indice.isin(list(claves))]
+        return self.actualizar(df)
+
+    def _ventanas(self, df):
+        """Filas de df dentro de los últimos VENTANA_REVISION meses guardados de cada serie."""
+        limites = pd.DataFrame(
+            [(region, codigo, e['ultimo_periodo']) for (region, codigo), e in self.series.items()],
+            columns=['Region', 'Codigo', 'limite']
+        )
+        limites['desde'] = (
+            pd.PeriodIndex(limites['limite'], freq='M') - (VENTANA_REVISION - 1)
+        ).strftime('%Y-%m')
+        # Filtro vectorizado previo: el resto solo trabaja con los meses recientes
+        recientes = df[df['year_month'] >= limites['desde'].min()]
+        recientes = recientes.merge(limites, on=['Region', 'Codigo'], how='left')
+        return recientes
+
+    def huellas(self, df):
+        """Hash de los últimos VENTANA_REVISION meses guardados de cada serie."""
+        if not self.series:
+            return {}
+        df = self._ventanas(df)
+        df = df[(df['year_month'] >= df['desde']) & (df['year_month'] <= df['limite'])]
+        df = df.sort_values(['Region', 'Codigo', 'Periodo'])
+        hashes = pd.util.hash_pandas_object(df[COLUMNAS_HUELLA], index=False)
+        return {
+            clave: hashlib.sha256(grupo.to_numpy().tobytes()).hexdigest()[:16]
+            for clave, grupo in hashes.groupby([df['Region'], df['Codigo']])
+        }
+
+    def revisadas(self, df):
+        """
+        Series que hay que recalcular desde cero: las que INDEC revisó dentro de la
+        ventana (o rebasó), las que ya no están en df y las que aparecen por primera vez.
+        """
+        actuales = self.huellas(df)
+        recientes = self._ventanas(df)
+        nuevas = recientes.loc[recientes['limite'].isna(), ['Region', 'Codigo']].drop_duplicates()
+        cambiadas = {clave for clave, e in self.series.items() if e.get('huella') != actuales.get(clave)}
+        return cambiadas | set(nuevas.itertuples(index=False, name=None))
+
+    def sellar(self, df):
+        """Registra la huella de los últimos períodos incorporados para detectar revisiones."""
+        for clave, huella in self.huellas(df).items():
+            self.series[clave]['huella'] = huella
+
+    def ultimo_periodo(self):
+        """Período (YYYY-MM) hasta el que todas las series están al día, o None."""
+        return min((e['ultimo_periodo'] for e in self.series.values()), default=None)
+
+    def tabla(self):
+        """Filas publicables de la tabla, ordenadas por región y código."""
+        filas = []
+        for clave in sorted(self.series):
+            estado = self.series[clave]
+            filas.append({k: v for k, v in estado.items() if k not in CAMPOS_ESTADO})
+        return filas
+
+    def guardar(self, ruta=RUTA_ESTADISTICAS):
+        """
+        Guarda la tabla junto con el estado incremental (escritura atómica).
+        El estado incluye la lista ordenada de variaciones de cada serie (para los
+        percentiles exactos), así que el archivo se reescribe entero: O(historia total).
+        """
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        datos = {'umbral': self.umbral, 'series': list(self.series.values())}
+        tmp = f'{ruta}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(datos, f, ensure_ascii=False)
+        os.replace(tmp, ruta)
+
+    @classmethod
+    def cargar(cls, ruta=RUTA_ESTADISTICAS, umbral=UMBRAL_RACHA):
+        """Carga la tabla guardada; si no existe o cambió el umbral, devuelve una vacía."""
+        estadisticas = cls(umbral)
+        try:
+            with open(ruta, 'r', encoding='utf-8') as f:
+                datos = json.load(f)
+        except (OSError, ValueError):
+            return estadisticas
+        if datos.get('umbral') != umbral:
+            return estadisticas
+        estadisticas.series = {(e['region'], e['codigo']): e for e in datos['series']}
+        return estadisticas
+
+
+def cargar_tabla(ruta=RUTA_ESTADISTICAS):
+    """Filas publicables de la tabla guardada (lista vacía si no existe)."""
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            datos = json.load(f)
+    except (OSError, ValueError):
+        return []
+    series = sorted(datos['series'], key=lambda e: (e['region'], e['codigo']))
+    return [{k: v for k, v in e.items() if k not in CAMPOS_ESTADO} for e in series]
+
+
+def actualizar_estadisticas(df, ruta=RUTA_ESTADISTICAS, umbral=UMBRAL_RACHA, reconstruir=False):
+    """
+    Actualiza la tabla guardada con los períodos nuevos de df y la persiste.
+    Las series cuyos últimos VENTANA_REVISION meses guardados cambiaron se
+    recalculan desde cero.
+    """
+    estadisticas = EstadisticasIPC.cargar(ruta, umbral)
+    if reconstruir or not estadisticas.series:
+        agregados = estadisticas.reconstruir(df)
+    else:
+        revisadas = estadisticas.revisadas(df)
+        agregados = estadisticas.reconstruir(df, revisadas) if revisadas else 0
+        ultimo = estadisticas.ultimo_periodo()
+        if ultimo is not None:
+            # Solo se recorren las filas posteriores al último período guardado
+            agregados += estadisticas.actualizar(df[df['year_month'] > ultimo])
+        if not agregados and not revisadas:
+            return estadisticas, 0
+    estadisticas.sellar(df)
+    estadisticas.guardar(ruta)
+    return estadisticas, agregados
+
+
+if __name__ == '__main__':
+    # Configurar argumentos de línea de comandos
+    parser = argparse.ArgumentParser(
+        description='Actualiza la tabla materializada de estadísticas del IPC'
+    )
+    parser.add_argument(
+        '--umbral',
+        type=float,
+        default=UMBRAL_RACHA,
+        help=f'Variación mensual (%%) para contar rachas (default: {UMBRAL_RACHA})'
+    )
+    parser.add_argument(
+        '--reconstruir',
+        action='store_true',
+        help=f'Recalcular todas las series desde cero (por ejemplo, si INDEC revisó meses anteriores a los últimos {VENTANA_REVISION})'
+    )
+
+    args = parser.parse_args()
+
+    print('Cargando datos del IPC desde INDEC...')
+    df = leer_ipc()
+
+    inicio = time.perf_counter()
+    estadisticas, agregados = actualizar_estadisticas(
+        df, umbral=args.umbral, reconstruir=args.reconstruir
+    )
+    print(f'✓ {agregados} períodos incorporados a {len(estadisticas.series)} series '
+          f'en {time.perf_counter() - inicio:.3f}s')
+
+    print('\n' + '=' * 80)
+    print('ESTADÍSTICAS NIVEL GENERAL POR REGIÓN')
+    print('=' * 80)
+    for fila in estadisticas.tabla():
+        if fila['codigo'] != '0':
+            continue
+        volatilidad = fila['volatilidad_12m']
+        print(f"  {fila['region']:12s}: Var.Mensual {fila['v_m']:5.2f}% | "
+              f"Acumulada {fila['inflacion_acumulada']:9.2f}% | "
+              f"Volatilidad 12m {volatilidad if volatilidad is not None else float('nan'):5.2f} | "
+              f"Racha > {args.umbral}%: {fila['racha_maxima']} meses")
+    print('=' * 80)
+    print(f'Tabla guardada en {RUTA_ESTADISTICAS}')
@@ -0,0 +1,155 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = [
+#   "pandas",
+#   "pyarrow",
+# ]
+# ///
+"""
+Script para exportar la serie normalizada del IPC en formato Arrow IPC (Feather v2)
+Los consumidores pueden mapear el archivo en memoria sin copiar ni re-parsear el CSV
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+
+from ipc_datos import RUTA_CSV, leer_ipc
+
+RUTA_ARROW = 'data/serie_ipc_divisiones.arrow'
+
+# Esquema fijo para que todos los consumidores vean los mismos tipos
+ESQUEMA = pa.schema([
+    ('Codigo', pa.dictionary(pa.int32(), pa.string())),
+    ('Descripcion', pa.dictionary(pa.int32(), pa.string())),
+    ('Clasificador', pa.dictionary(pa.int32(), pa.string())),
+    ('Periodo', pa.timestamp('s')),
+    ('Indice_IPC', pa.float64()),
+    ('v_m_IPC', pa.float64()),
+    ('v_i_a_IPC', pa.float64()),
+    ('Region', pa.dictionary(pa.int32(), pa.string())),
+])
+
+# Tipo de Periodo que produce leer_ipc() con la versión de pandas instalada
+DTYPE_PERIODO = pd.to_datetime(pd.Series(['201612']), format='%Y%m').dtype
+
+
+def tabla_ipc(df):
+    """Convierte el DataFrame normalizado a una tabla Arrow con el esquema fijo."""
+    return pa.Table.from_pandas(df[ESQUEMA.names], schema=ESQUEMA, preserve_index=False)
+
+
+def escribir_arrow(tabla, ruta=RUTA_ARROW):
+    """Escribe la tabla como archivo Arrow IPC sin compresión (apto para mmap)."""
+    # Reemplazo atómico: quien tenga mapeada la versión anterior no ve un archivo truncado
+    tmp = f'{ruta}.tmp'
+    with pa.OSFile(tmp, 'wb') as sink:
+        with ipc.new_file(sink, tabla.schema) as writer:
+            writer.write_table(tabla)
+    os.replace(tmp, ruta)
+
+
+def escribir_stream(tabla, salida=None):
+    """Escribe la tabla como stream Arrow IPC (por defecto en stdout)."""
+    salida = salida or sys.stdout.buffer
+    with ipc.new_stream(salida, tabla.schema) as writer:
+        writer.write_table(tabla)
+    salida.flush()
+
+
+def leer_arrow(ruta=RUTA_ARROW):
+    """Mapea el archivo Arrow en memoria y devuelve la tabla (sin copiar los buffers)."""
+    with pa.memory_map(ruta, 'r') as fuente:
+        return ipc.open_file(fuente).read_all()
+
+
+def leer_arrow_df(ruta=RUTA_ARROW):
+    """
+    Lee el archivo Arrow y devuelve el mismo DataFrame que leer_ipc():
+    textos como str (no category), Periodo con el tipo de pandas y year_month.
+    """
+    tabla = leer_arrow(ruta)
+    esquema = pa.schema([
+        pa.field(campo.name, pa.string()) if pa.types.is_dictionary(campo.type) else campo
+        for campo in tabla.schema
+    ])
+    tabla = tabla.cast(esquema)
+    tabla = tabla.append_column('year_month', pc.strftime(tabla['Periodo'], format='%Y-%m'))
+    df = tabla.to_pandas()
+    df['Periodo'] = df['Periodo'].astype(DTYPE_PERIODO)
+    return df
+
+
+def medir(funcion, repeticiones):
+    """Devuelve el mejor tiempo (en segundos) de varias ejecuciones."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+if __name__ == '__main__':
+    # Configurar argumentos de línea de comandos
+    parser = argparse.ArgumentParser(
+        description='Exporta la serie normalizada del IPC en formato Arrow IPC'
+    )
+    parser.add_argument(
+        '--salida',
+        type=str,
+        default=RUTA_ARROW,
+        help=f'Archivo Arrow de salida (default: {RUTA_ARROW})'
+    )
+    parser.add_argument(
+        '--stdout',
+        action='store_true',
+        help='Escribir además un stream Arrow IPC en stdout (los mensajes van a stderr)'
+    )
+    parser.add_argument(
+        '--benchmark',
+        action='store_true',
+        help='Comparar el tiempo de carga del CSV con la lectura del archivo Arrow'
+    )
+    parser.add_argument(
+        '--repeticiones',
+        type=int,
+        default=5,
+        help='Repeticiones del benchmark (default: 5)'
+    )
+
+    args = parser.parse_args()
+
+    # Con --stdout los mensajes no deben mezclarse con el stream
+    log = sys.stderr if args.stdout else sys.stdout
+
+    print('Cargando datos del IPC desde INDEC...', file=log)
+    tabla = tabla_ipc(leer_ipc())
+
+    escribir_arrow(tabla, args.salida)
+    print(f'✓ {tabla.num_rows} registros exportados a {args.salida}', file=log)
+
+    if args.stdout:
+        escribir_stream(tabla)
+
+    if args.benchmark:
+        print('\n' + '=' * 80, file=log)
+        print('BENCHMARK DE CARGA', file=log)
+        print('=' * 80, file=log)
+
+        t_csv = medir(lambda: leer_ipc(RUTA_CSV), args.repeticiones)
+        t_arrow = medir(lambda: leer_arrow(args.salida), args.repeticiones)
+        t_pandas = medir(lambda: leer_arrow(args.salida).to_pandas(), args.repeticiones)
+        t_df = medir(lambda: leer_arrow_df(args.salida), args.repeticiones)
+
+        print(f'CSV (pd.read_csv + normalización): {t_csv * 1000:8.2f} ms', file=log)
+        print(f'Arrow (memory map):                {t_arrow * 1000:8.2f} ms ({t_csv / t_arrow:.0f}x)', file=log)
+        print(f'Arrow (memory map + to_pandas):    {t_pandas * 1000:8.2f} ms ({t_csv / t_pandas:.0f}x)', file=log)
+        print(f'Arrow (leer_arrow_df, = leer_ipc): {t_df * 1000:8.2f} ms ({t_csv / t_df:.0f}x)', file=log)
+        print('=' * 80, file=log)
@@ -13,16 +13,9 @@ import os
 from datetime import datetime
 from jinja2 import Template
 
-# Obtener fecha de última actualización de los datos
-try:
-    datos_timestamp = os.path.getmtime('data/serie_ipc_divisiones.csv')
-    fecha_datos = datetime.fromtimestamp(datos_timestamp).strftime('%d/%m/%Y %H:%M:%S')
-except:
-    fecha_datos = 'No disponible'
+from estadisticas_ipc import cargar_tabla
+from ipc_datos import RUTA_CSV
 
-# Obtener todos los archivos HTML
-graficos_dir = 'graficos'
-html_files = sorted(glob.glob(f'{graficos_dir}/ipc_*.html'))
 
 # Definir regiones y sus etiquetas
 regiones_info = {
@@ -62,104 +55,139 @@ graficos_info = {
         'titulo': 'Inflación Acumulada',
         'descripcion': 'Inflación acumulada desde diciembre 2016'
     },
+    'desestacionalizado': {
+        'titulo': 'Variación Mensual Desestacionalizada',
+        'descripcion': 'Variación mensual sin el componente estacional (STL)'
+    },
+    'dispersion': {
+        'titulo': 'Dispersión Regional',
+        'descripcion': 'Desvío estándar y rango entre regiones de la variación mensual (móvil 12 meses)'
+    },
+    'correlacion': {
+        'titulo': 'Correlación entre Regiones',
+        'descripcion': 'Matriz de correlación móvil de 12 meses entre regiones'
+    },
+    'brecha_divisiones': {
+        'titulo': 'Brecha Regional por División',
+        'descripcion': 'Diferencia máxima entre regiones de la variación mensual por división'
+    },
     'ranking': {
         'titulo': 'Ranking Regional',
         'descripcion': 'Ranking de inflación acumulada en últimos 12 meses'
     }
 }
 
-# Organizar gráficos por región
-graficos_por_region = {region: [] for region in regiones_info.keys()}
-
-for html_file in html_files:
-    basename = os.path.basename(html_file)
-
-    # Determinar región
-    region = None
-    for key in regiones_info.keys():
-        if f'ipc_{key}_' in basename:
-            region = key
-            break
-
-    if not region:
-        continue
-
-    # Determinar tipo de gráfico
-    tipo = None
-    titulo = None
-    descripcion = 'Gráfico del IPC'
-
-    for key, info in graficos_info.items():
-        if key in basename:
-            tipo = key
-            titulo = info['titulo']
-            descripcion = info['descripcion']
-            break
-
-    if not titulo:
-        continue
-
-    graficos_por_region[region].append({
-        'filename': f'{graficos_dir}/{basename}',
-        'title': titulo,
-        'description': descripcion,
-        'tipo': tipo
-    })
-
-# Ordenar gráficos dentro de cada región
-orden_tipos = ['indice', 'variacion_mensual', 'variacion_interanual',
-               'ultimos_12_meses', 'heatmap', 'acumulado', 'ranking']
-
-for region in graficos_por_region:
-    graficos_por_region[region].sort(
-        key=lambda x: orden_tipos.index(x['tipo']) if x['tipo'] in orden_tipos else 999
-    )
 
-# Preparar estructura para el template
-graficos_agrupados = []
+def generar_index(graficos_dir='graficos'):
+    """Genera index.html con los gráficos de graficos_dir agrupados por región."""
+    # Obtener fecha de última actualización de los datos
+    try:
+        datos_timestamp = os.path.getmtime(RUTA_CSV)
+        fecha_datos = datetime.fromtimestamp(datos_timestamp).strftime('%d/%m/%Y %H:%M:%S')
+    except:
+        fecha_datos = 'No disponible'
+
+    # Obtener todos los archivos HTML
+    html_files = sorted(glob.glob(f'{graficos_dir}/ipc_*.html'))
+
+    # Organizar gráficos por región
+    graficos_por_region = {region: [] for region in regiones_info.keys()}
+
+    for html_file in html_files:
+        basename = os.path.basename(html_file)
+
+        # Determinar región
+        region = None
+        for key in regiones_info.keys():
+            if f'ipc_{key}_' in basename:
+                region = key
+                break
+
+        if not region:
+            continue
+
+        # Determinar tipo de gráfico
+        tipo = None
+        titulo = None
+        descripcion = 'Gráfico del IPC'
+
+        for key, info in graficos_info.items():
+            if key in basename:
+                tipo = key
+                titulo = info['titulo']
+                descripcion = info['descripcion']
+                break
+
+        if not titulo:
+            continue
+
+        graficos_por_region[region].append({
+            'filename': f'{graficos_dir}/{basename}',
+            'title': titulo,
+            'description': descripcion,
+            'tipo': tipo
+        })
+
+    # Ordenar gráficos dentro de cada región
+    orden_tipos = ['indice', 'variacion_mensual', 'variacion_interanual',
+                   'ultimos_12_meses', 'heatmap', 'acumulado', 'desestacionalizado',
+                   'ranking', 'dispersion', 'correlacion', 'brecha_divisiones']
 
-# Primero la sección de comparación
-if graficos_por_region['comparacion']:
-    graficos_agrupados.append({
-        'label': regiones_info['comparacion'],
-        'graficos': graficos_por_region['comparacion'],
-        'region_key': 'comparacion'
-    })
+    for region in graficos_por_region:
+        graficos_por_region[region].sort(
+            key=lambda x: orden_tipos.index(x['tipo']) if x['tipo'] in orden_tipos else 999
+        )
 
-# Luego todas las demás regiones
-for region_key, region_label in regiones_info.items():
-    if region_key != 'comparacion' and graficos_por_region[region_key]:
+    # Preparar estructura para el template
+    graficos_agrupados = []
+
+    # Primero la sección de comparación
+    if graficos_por_region['comparacion']:
         graficos_agrupados.append({
-            'label': region_label,
-            'graficos': graficos_por_region[region_key],
-            'region_key': region_key
+            'label': regiones_info['comparacion'],
+            'graficos': graficos_por_region['comparacion'],
+            'region_key': 'comparacion'
         })
 
-# Cargar template y renderizar
-with open('index.jinja', 'r', encoding='utf-8') as f:
-    template_content = f.read()
-
-# Contar total de gráficos
-total_graficos = sum(len(grupo['graficos']) for grupo in graficos_agrupados)
-
-template = Template(template_content)
-html_output = template.render(
-    fecha_datos=fecha_datos,
-    graficos_agrupados=graficos_agrupados,
-    total_graficos=total_graficos
-)
-
-with open('index.html', 'w', encoding='utf-8') as f:
-    f.write(html_output)
-
-print('=' * 80)
-print('INDEX.HTML GENERADO EXITOSAMENTE')
-print('=' * 80)
-print(f'Fecha de datos: {fecha_datos}')
-print(f'Total de regiones: {len(graficos_agrupados)}')
-print(f'Total de gráficos: {total_graficos}')
-print('\nGráficos por región:')
-for grupo in graficos_agrupados:
-    print(f'  {grupo["label"]:30s}: {len(grupo["graficos"])} gráficos')
-print('=' * 80)
-print('✓ Archivo index.html actualizado')
+    # Luego todas las demás regiones
+    for region_key, region_label in regiones_info.items():
+        if region_key != 'comparacion' and graficos_por_region[region_key]:
+            graficos_agrupados.append({
+                'label': region_label,
+                'graficos': graficos_por_region[region_key],
+                'region_key': region_key
+            })
+
+    # Cargar template y renderizar
+    with open('index.jinja', 'r', encoding='utf-8') as f:
+        template_content = f.read()
+
+    # Contar total de gráficos
+    total_graficos = sum(len(grupo['graficos']) for grupo in graficos_agrupados)
+
+    template = Template(template_content)
+    html_output = template.render(
+        fecha_datos=fecha_datos,
+        graficos_agrupados=graficos_agrupados,
+        total_graficos=total_graficos,
+        estadisticas=cargar_tabla()
+    )
+
+    with open('index.html', 'w', encoding='utf-8') as f:
+        f.write(html_output)
+
+    print('=' * 80)
+    print('INDEX.HTML GENERADO EXITOSAMENTE')
+    print('=' * 80)
+    print(f'Fecha de datos: {fecha_datos}')
+    print(f'Total de regiones: {len(graficos_agrupados)}')
+    print(f'Total de gráficos: {total_graficos}')
+    print('\nGráficos por región:')
+    for grupo in graficos_agrupados:
+        print(f'  {grupo["label"]:30s}: {len(grupo["graficos"])} gráficos')
+    print('=' * 80)
+    print('✓ Archivo index.html actualizado')
+
+
+if __name__ == '__main__':
+    generar_index()
@@ -0,0 +1,64 @@
+"""
+Funciones compartidas para cargar y normalizar la serie del IPC del INDEC
+"""
+
+import io
+
+import pandas as pd
+
+RUTA_CSV = 'data/serie_ipc_divisiones.csv'
+
+# Parámetros de lectura del CSV publicado por INDEC
+OPCIONES_CSV = dict(encoding='latin1', sep=';', decimal=',', na_values=['NA'])
+
+# Clave natural de cada fila de la serie
+CLAVE = ['Region', 'Codigo', 'Periodo']
+
+# Filas por bloque al leer archivos grandes
+TAMANO_CHUNK = 200_000
+
+
+def normalizar_ipc(df):
+    """Limpia nombres de columnas y convierte el período a datetime."""
+    df.columns = df.columns.str.strip()
+    df['Periodo'] = pd.to_datetime(df['Periodo'].astype(str), format='%Y%m')
+    df['year_month'] = df['Periodo'].dt.strftime('%Y-%m')
+    return df
+
+
+def leer_ipc(ruta=RUTA_CSV):
+    """Lee el CSV del IPC y devuelve el DataFrame normalizado."""
+    df = pd.read_csv(ruta, dtype={'Codigo': str}, **OPCIONES_CSV)
+    return normalizar_ipc(df)
+
+
+def parsear_lineas(encabezado, lineas):
+    """Parsea un subconjunto de líneas crudas del CSV (sin el encabezado)."""
+    texto = '\n'.join([encabezado, *lineas])
+    opciones = {k: v for k, v in OPCIONES_CSV.items() if k != 'encoding'}
+    df = pd.read_csv(io.StringIO(texto), dtype={'Codigo': str}, **opciones)
+    return normalizar_ipc(df)
+
+
+def leer_region_por_chunks(region, periodo_inicial=None, ruta=RUTA_CSV, tamano_chunk=TAMANO_CHUNK):
+    """
+    Lee el CSV por bloques y conserva solo las filas de `region` desde
+    `periodo_inicial` (YYYYMM), de modo que la memoria depende del resultado
+    y no del tamaño del archivo.
+    Devuelve (DataFrame normalizado y ordenado por período, regiones vistas).
+    """
+    partes = []
+    regiones = set()
+    lector = pd.read_csv(ruta, dtype={'Codigo': str}, chunksize=tamano_chunk, **OPCIONES_CSV)
+    for chunk in lector:
+        chunk.columns = chunk.columns.str.strip()
+        regiones.update(chunk['Region'].dropna().unique())
+
+        # Filtrar antes de convertir fechas para no procesar filas descartadas
+        chunk = chunk[chunk['Region'] == region]
+        if periodo_inicial:
+            chunk = chunk[chunk['Periodo'] >= int(periodo_inicial)]
+        partes.append(chunk)
+
+    df = pd.concat(partes, ignore_index=True)
+    return normalizar_ipc(df).sort_values('Periodo'), regiones
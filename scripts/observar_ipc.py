@@ -0,0 +1,187 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = [
+#   "pandas",
+#   "plotly",
+#   "jinja2",
+#   "statsmodels",
+# ]
+# ///
+"""
+Script para observar el CSV del IPC y regenerar los gráficos cuando cambia
+Mantiene los datos cargados en memoria y solo re-parsea las filas modificadas
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+import pandas as pd
+
+from ajuste_estacional import desestacionalizar
+from analizar_ipc import filtrar_region, generar_graficos_region
+from comparar_regiones import comparar_regiones
+from estadisticas_ipc import actualizar_estadisticas
+from generar_index import generar_index
+from ipc_datos import CLAVE, RUTA_CSV, leer_ipc, parsear_lineas
+
+
+class DatosIPC:
+    """Serie del IPC en memoria, indexada por (Region, Codigo, Periodo)."""
+
+    def __init__(self, ruta=RUTA_CSV):
+        self.ruta = ruta
+        self._cargar()
+
+    def _cargar(self):
+        self.df = leer_ipc(self.ruta).set_index(CLAVE, drop=False).sort_index()
+        self.encabezado, self.lineas = self._leer_lineas()
+        self.estadisticas, _ = actualizar_estadisticas(self.df.reset_index(drop=True))
+
+    def _leer_lineas(self):
+        with open(self.ruta, 'r', encoding='latin1') as f:
+            lineas = f.read().splitlines()
+        return lineas[0], set(l for l in lineas[1:] if l.strip())
+
+    def actualizar(self):
+        """
+        Aplica los cambios del archivo a los datos en memoria.
+        Devuelve (regiones afectadas, si hay que regenerar las comparaciones).
+        Las comparaciones usan NIVEL GENERAL de todas las regiones y todas las
+        divisiones de las regiones sin Nacional (dispersión, correlación y brecha).
+        """
+        encabezado, lineas = self._leer_lineas()
+        if encabezado != self.encabezado:
+            # Cambió la estructura del archivo: recargar todo
+            self._cargar()
+            return set(self.df['Region'].unique()), True
+
+        eliminadas = self.lineas - lineas
+        nuevas = lineas - self.lineas
+        self.lineas = lineas
+        if not eliminadas and not nuevas:
+            return set(), False
+
+        # Solo se parsean las líneas que cambiaron
+        df_eliminadas = parsear_lineas(encabezado, sorted(eliminadas))
+        df_nuevas = parsear_lineas(encabezado, sorted(nuevas))
+        cambios = pd.concat([df_eliminadas, df_nuevas])
+
+        claves = pd.MultiIndex.from_frame(df_eliminadas[CLAVE])
+        df = self.df.drop(index=claves, errors='ignore')
+        df = pd.concat([df, df_nuevas.set_index(CLAVE, drop=False)])
+        df = df[~df.index.duplicated(keep='last')]
+        self.df = df.sort_index()
+
+        # Series revisadas se recalculan; el resto solo incorpora los períodos nuevos
+        df_completo = self.df.reset_index(drop=True)
+        revisadas = set(zip(df_eliminadas['Region'], df_eliminadas['Codigo']))
+        if revisadas:
+            self.estadisticas.reconstruir(df_completo, revisadas)
+        self.estadisticas.actualizar(df_nuevas)
+        self.estadisticas.sellar(df_completo)
+        self.estadisticas.guardar()
+
+        regiones = set(cambios['Region'].dropna().unique())
+        comparaciones = ((cambios['Descripcion'] == 'NIVEL GENERAL') | (cambios['Region'] != 'Nacional')).any()
+        return regiones, comparaciones
+
+
+def reconstruir(datos, regiones, comparaciones, inicio, graficos_dir, periodo_inicial):
+    """Regenera los gráficos afectados y el index.html."""
+    df = datos.df.reset_index(drop=True)
+    # Solo se recalculan las series modificadas, el resto sale de la caché.
+    # Este código corre en un hilo: se usa 'spawn' para no hacer fork de un proceso con hilos
+    df['v_m_IPC_desest'], _ = desestacionalizar(df, mp_context=multiprocessing.get_context('spawn'))
+    for region in sorted(regiones):
+        df_region = filtrar_region(df, region, periodo_inicial)
+        if len(df_region) > 0:
+            generar_graficos_region(df_region, region, graficos_dir)
+    if comparaciones:
+        comparar_regiones(df, graficos_dir)
+    generar_index(graficos_dir)
+
+    print(f'\n✓ Reconstrucción completada en {time.time() - inicio:.2f}s '
+          f'desde el cambio del archivo ({", ".join(sorted(regiones))})')
+
+
+def trabajador(datos, pendientes, graficos_dir, periodo_inicial):
+    """Procesa las reconstrucciones pendientes, agrupando cambios acumulados."""
+    while True:
+        regiones, comparaciones, inicio = pendientes.get()
+        # Agrupar cambios que llegaron mientras se reconstruía
+        while not pendientes.empty():
+            mas_regiones, mas_comparaciones, _ = pendientes.get()
+            regiones |= mas_regiones
+            comparaciones = comparaciones or mas_comparaciones
+        try:
+            reconstruir(datos, regiones, comparaciones, inicio, graficos_dir, periodo_inicial)
+        except Exception as e:
+            print(f'Error al reconstruir los gráficos: {e}')
+
+
+if __name__ == '__main__':
+    # Configurar argumentos de línea de comandos
+    parser = argparse.ArgumentParser(
+        description='Observa el CSV del IPC y regenera los gráficos afectados cuando cambia'
+    )
+    parser.add_argument(
+        '--intervalo',
+        type=float,
+        default=1.0,
+        help='Segundos entre cada verificación del archivo (default: 1.0)'
+    )
+    parser.add_argument(
+        '--periodo-inicial',
+        type=str,
+        default=None,
+        help='Período inicial en formato YYYYMM (ej: 201612). Si no se especifica, usa todos los datos'
+    )
+    parser.add_argument(
+        '--generar-inicial',
+        action='store_true',
+        help='Generar todos los gráficos al iniciar, antes de observar cambios'
+    )
+
+    args = parser.parse_args()
+    graficos_dir = 'graficos'
+
+    print('Cargando datos del IPC desde INDEC...')
+    datos = DatosIPC()
+    mtime = os.stat(datos.ruta).st_mtime
+    print(f'✓ {len(datos.df)} registros en memoria')
+
+    pendientes = queue.Queue()
+    threading.Thread(
+        target=trabajador,
+        args=(datos, pendientes, graficos_dir, args.periodo_inicial),
+        daemon=True
+    ).start()
+
+    if args.generar_inicial:
+        pendientes.put((set(datos.df['Region'].unique()), True, time.time()))
+
+    print(f'Observando {datos.ruta} (Ctrl+C para salir)...')
+    try:
+        while True:
+            time.sleep(args.intervalo)
+            try:
+                nuevo_mtime = os.stat(datos.ruta).st_mtime
+            except FileNotFoundError:
+                continue
+            if nuevo_mtime == mtime:
+                continue
+            mtime = nuevo_mtime
+
+            regiones, comparaciones = datos.actualizar()
+            if not regiones:
+                print('Archivo modificado sin cambios en los datos')
+                continue
+
+            print(f'\nCambios detectados en: {", ".join(sorted(regiones))}')
+            pendientes.put((regiones, comparaciones, mtime))
+    except KeyboardInterrupt:
+        print('\n✓ Observación finalizada')
@@ -0,0 +1,153 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = []
+# ///
+"""
+Servidor HTTP local que imita el FTP web del INDEC para pruebas y benchmarks sin red
+Responde con ETag/Last-Modified, 304 condicionales y rangos (206) como el servidor real
+"""
+
+import argparse
+import email.utils
+import hashlib
+import os
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class ManejadorINDEC(BaseHTTPRequestHandler):
+    """Sirve los archivos de `directorio` con soporte de pedidos condicionales."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def __init__(self, *args, directorio, latencia=0.0, cortar_en=None, registrar=True, **kwargs):
+        self.directorio = directorio
+        self.latencia = latencia
+        self.cortar_en = cortar_en
+        self.registrar = registrar
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, formato, *args):
+        if self.registrar:
+            print(f'[servidor] {self.command} {self.path} -> {formato % args}')
+
+    def _validadores(self, ruta):
+        estado = os.stat(ruta)
+        etag = '"' + hashlib.sha256(f'{estado.st_mtime_ns}-{estado.st_size}'.encode()).hexdigest()[:16] + '"'
+        ultima_modificacion = email.utils.formatdate(estado.st_mtime, usegmt=True)
+        return etag, ultima_modificacion, estado.st_mtime
+
+    def _enviar_vacio(self, codigo, headers=()):
+        self.send_response(codigo)
+        for nombre, valor in headers:
+            self.send_header(nombre, valor)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        if self.latencia:
+            time.sleep(self.latencia)
+
+        nombre = os.path.basename(self.path.split('?')[0])
+        ruta = os.path.join(self.directorio, nombre)
+        if not nombre or not os.path.isfile(ruta):
+            self._enviar_vacio(404)
+            return
+
+        etag, ultima_modificacion, mtime = self._validadores(ruta)
+        validadores = [('ETag', etag), ('Last-Modified', ultima_modificacion)]
+
+        # Pedidos condicionales: If-None-Match tiene prioridad sobre If-Modified-Since
+        if_none_match = self.headers.get('If-None-Match')
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_none_match is not None:
+            if etag in [v.strip() for v in if_none_match.split(',')]:
+                self._enviar_vacio(304, validadores)
+                return
+        elif if_modified_since:
+            fecha = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            if int(mtime) <= fecha:
+                self._enviar_vacio(304, validadores)
+                return
+
+        with open(ruta, 'rb') as f:
+            contenido = f.read()
+
+        # Rangos: solo se respetan si If-Range coincide con la versión actual
+        inicio = 0
+        rango = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        if rango and rango.startswith('bytes=') and if_range in (None, etag, ultima_modificacion):
+            inicio = int(rango[len('bytes='):].split('-')[0])
+
+        cuerpo = contenido[inicio:]
+        if inicio:
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {inicio}-{len(contenido) - 1}/{len(contenido)}')
+        else:
+            self.send_response(200)
+        for nombre_header, valor in validadores:
+            self.send_header(nombre_header, valor)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+
+        # Simular una transferencia cortada para probar la reanudación (los rangos se completan)
+        if self.cortar_en is not None and not inicio and len(cuerpo) > self.cortar_en:
+            self.wfile.write(cuerpo[:self.cortar_en])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(cuerpo)
+
+
+def crear_servidor(directorio, host='127.0.0.1', puerto=8000, latencia=0.0, cortar_en=None,
+                   registrar=True):
+    """Crea el servidor; con puerto 0 se elige uno libre (ver server_address)."""
+    manejador = partial(ManejadorINDEC, directorio=directorio, latencia=latencia,
+                        cortar_en=cortar_en, registrar=registrar)
+    return ThreadingHTTPServer((host, puerto), manejador)
+
+
+if __name__ == '__main__':
+    # Configurar argumentos de línea de comandos
+    parser = argparse.ArgumentParser(
+        description='Servidor HTTP local que imita al INDEC para pruebas sin red'
+    )
+    parser.add_argument(
+        '--directorio',
+        type=str,
+        default='data',
+        help='Directorio con los archivos a servir (default: data)'
+    )
+    parser.add_argument(
+        '--puerto',
+        type=int,
+        default=8000,
+        help='Puerto de escucha (default: 8000)'
+    )
+    parser.add_argument(
+        '--latencia',
+        type=float,
+        default=0.0,
+        help='Segundos de demora por pedido, para simular la red (default: 0)'
+    )
+    parser.add_argument(
+        '--cortar-en',
+        type=int,
+        default=None,
+        help='Cortar las respuestas completas tras N bytes para probar descargas reanudables'
+    )
+
+    args = parser.parse_args()
+
+    servidor = crear_servidor(args.directorio, puerto=args.puerto,
+                              latencia=args.latencia, cortar_en=args.cortar_en)
+    host, puerto = servidor.server_address
+    print(f'Sirviendo {args.directorio}/ en http://{host}:{puerto} (Ctrl+C para salir)')
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print('\n✓ Servidor detenido')